@@ -1,4 +1,3 @@
 import main
-import sys
 
 main.main()
\ No newline at end of file
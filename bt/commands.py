@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import copy
 import logging
 import datetime
+import dataclasses
 import csv
 import os
 
@@ -21,6 +21,16 @@ from validators import VDay, VMonth, VYear, VType, VTarget, VID, VAmount
 import converter
 
 
+# Answers accepted at the prompts
+QUIT = frozenset(("q", "quit"))
+YES_NO = frozenset(("yes", "no", "y", "n"))
+YES = frozenset(("yes", "y"))
+
+# Validators for the month, day and year of a date prompt, in the order
+# they're applied
+DATE_VALIDATORS = (VMonth(), VDay(), VYear(default=TODAY.year))
+
+
 class AbortInput(Exception):
     """An exception for the user to abort input."""
 
@@ -30,7 +40,7 @@ def get_date() -> datetime.date | None:
     display.refresh()
     date = input("Date: ")
 
-    if date.lower() in ("q", "quit"):
+    if date.lower() in QUIT:
         raise AbortInput("Input aborted by user.")
 
     date = date.split()
@@ -38,9 +48,7 @@ def get_date() -> datetime.date | None:
     if not date:
         return TODAY
     elif 2 <= len(date) <= 3:
-        month = VMonth()(date)
-        day = VDay()(date)
-        year = VYear(default=config.TODAY.year)(date)
+        month, day, year = [validate(date) for validate in DATE_VALIDATORS]
         return datetime.date(year, month, day)
     else:
         display.message("Invalid input.")
@@ -51,7 +59,7 @@ def get_amount() -> int | None:
     display.refresh()
     amount = input("Amount: ").strip()
 
-    if amount.lower() in ("q", "quit"):
+    if amount.lower() in QUIT:
         raise AbortInput("Input aborted by user.")
 
     if not amount.startswith(("-", "+")):
@@ -72,7 +80,7 @@ def get_target() -> dict | None:
     display.refresh()
     t_input = input("Target: ").lower().strip()
 
-    if t_input in ("q", "quit"):
+    if t_input in QUIT:
         raise AbortInput("Input aborted by user.")
     if t_input == "help":
         display.message(f"({', '.join(target_names)})")
@@ -90,7 +98,7 @@ def get_note() -> str:
     display.refresh()
     note = input("Note: ")
 
-    if note.lower() in ("q", "quit"):
+    if note.lower() in QUIT:
         raise AbortInput("Input aborted by user.")
 
     if len(note) > 50:
@@ -125,7 +133,7 @@ input_functions = {
 
 def targets_exist() -> bool:
     """Check if user has created any targets."""
-    return bool(len(target.select()))
+    return target.any_exist()
 
 
 class ListTargetsCommand(kelevsma.Command):
@@ -204,7 +212,7 @@ class AddEntryTodayCommand(kelevsma.Command):
         note = " ".join(note)
         self.entry = entry.insert(Entry(0, date, amount, target, note))
 
-        date = date.strftime("%b %d")
+        date = util.date_str(date)
         amount = entry.dollar_str(self.entry.amount)
         display.message(f"Entry added: {date}, {amount}, {note}")
 
@@ -231,7 +239,7 @@ class AddEntryCommand(kelevsma.Command):
             return
         self.entry = entry.insert(Entry(0, date, amount, target, note))
 
-        date = date.strftime("%b %d")
+        date = util.date_str(date)
         amount = entry.dollar_str(self.entry.amount)
         display.message(f"Entry added: {date}, {amount}, {note}")
         
@@ -286,10 +294,10 @@ class RemoveEntryCommand(kelevsma.Command):
     def execute(self, id):
         self.entry = display.select(id)
         ans = None
-        while ans not in ("yes", "no", "y", "n"):
+        while ans not in YES_NO:
             display.refresh()
             ans = input("(Y/n) Are you sure you want to delete this entry? ").lower()
-        if ans in ("yes", "y"):
+        if ans in YES:
             entry.delete(self.entry)
         display.deselect()
 
@@ -317,10 +325,10 @@ class RemoveTargetCommand(kelevsma.Command):
             return
         # 'Are you sure' message
         ans = None
-        while ans not in ("yes", "no", "y", "n"):
+        while ans not in YES_NO:
             display.refresh()
             ans = input("(Y/n) Are you sure you want to delete this target? ").lower()
-        if ans in ("yes", "y"):
+        if ans in YES:
             target.delete(self.target)
         display.deselect()
 
@@ -359,9 +367,9 @@ class EditEntryCommand(kelevsma.Command):
         try:
             self.old_entry = display.select(id)
 
-            self.new_entry = copy.copy(self.old_entry)
             new_value = input_functions[field.lower()]()
-            setattr(self.new_entry, field, new_value)
+            # A new Entry, so the old entry's formatted string isn't reused
+            self.new_entry = dataclasses.replace(self.old_entry, **{field: new_value})
 
             entry.update(self.new_entry)
         except AbortInput as e:
@@ -387,7 +395,7 @@ class SetTargetDefaultCommand(kelevsma.Command):
 
     def execute(self, name, default, amount) -> None:
         self.old_target = target.select_one(name)
-        self.new_target = copy.copy(self.old_target)
+        self.new_target = self.old_target.clone()
         self.new_target.default_amt = amount
         target.update(self.new_target)
 
@@ -447,7 +455,7 @@ class RenameTargetCommand(kelevsma.Command):
 
     def execute(self, current_name, new_name) -> None:
         self.old_target = target.select_one(current_name)
-        self.new_target = copy.copy(self.old_target)
+        self.new_target = self.old_target.clone()
         self.new_target.name = new_name
         target.update(self.new_target)
 
@@ -490,11 +498,10 @@ class ExportCommand(kelevsma.Command):
             kelevsma.message(f"There are no entries for {year}.")
             return
 
-        with open(f"{year}_records.csv", "w", newline="") as f:
+        with open(f"{year}_records.csv", "w", newline="", buffering=config.CSV_BUFSIZE) as f:
             writer = csv.writer(f)
             writer.writerow(("date", "amount", "target", "note"))
-            for e in entries:
-                writer.writerow(e.to_csv())
+            writer.writerows(e.to_csv() for e in entries)
             path = os.path.join(os.getcwd(), f.name)
             kelevsma.message(f"{len(entries)} entries written to {path}.")
 
@@ -10,8 +10,9 @@ from util import TimeFrame, Month
 # Constants
 FILENAME = "config.json"
 TODAY = datetime.date.today()
-KEYWORDS = ("income", "expense", "all", "target", "targets", "entry", "entries", "default")
-KEYWORDS += tuple(Month.__members__)
+# Reserved words that can't be used as target names
+KEYWORDS = frozenset(("income", "expense", "all", "target", "targets", "entry",
+    "entries", "default", *Month.__members__))
 
 # Screen names
 ENTRIES = "entries"
@@ -24,6 +25,18 @@ AMOUNTW = 12
 TARGETW = 12
 NAMEW = 12  # For target names
 
+# Screen headers, formatted once from the widths above
+ENTRIES_HEADER = f"   {'DATE':{DATEW}}{' AMOUNT':{AMOUNTW}}{'TARGET':{TARGETW}}{'NOTE'}"
+TARGETS_HEADER = f"   {'NAME':{NAMEW}}{'PROGRESS'}"
+
+# Row template for entries with the widths above filled in
+ENTRY_FORMAT = f"{{:{DATEW}}}{{:{AMOUNTW}}}{{:{TARGETW}}}{{}}"
+# Names are padded and cut to NAMEW by the format spec itself
+TARGET_FORMAT = f"{{:{NAMEW}.{NAMEW}}}{{}} / {{}}"
+
+# Buffer size for reading and writing csv files
+CSV_BUFSIZE = 1 << 20
+
 
 @dataclass(slots=True)
 class TargetFilterState:
@@ -2,21 +2,37 @@
 
 import csv
 import datetime
+import operator
 
-import entry, target, util
+import kelevsma.db as kdb
+
+import config, entry, target, util
+
+
+COLUMNS = ("date", "amount", "category", "note")
 
 
 def main(filename:str):
-    with open(filename, "r") as f:
-        lines = f.readlines()
-        reader = csv.DictReader(lines)
-        for l in reader:
-            date = datetime.date.fromisoformat(l["date"].replace("/", "-"))
-            amount = util.dollars_to_cents(l["amount"])
-            targ = get_target(l["category"])
-            note = l["note"]
-            e = entry.Entry(0, date, amount, targ, note)
-            entry.insert(e)
+    with open(filename, "r", newline="", buffering=config.CSV_BUFSIZE) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        get_columns = operator.itemgetter(*[header.index(c) for c in COLUMNS])
+        try:
+            with kdb.transaction():
+                for row in reader:
+                    if not row:
+                        continue
+                    date, amount, category, note = get_columns(row)
+                    date = datetime.date.fromisoformat(date.replace("/", "-"))
+                    amount = util.dollars_to_cents(amount)
+                    targ = get_target(category)
+                    e = entry.Entry(0, date, amount, targ, note)
+                    entry.insert(e)
+        finally:
+            # Targets added by a rolled back import are gone from the db
+            target.clear_cache()
 
 
 def get_target(category:str) -> str:
@@ -13,16 +13,12 @@ TARGET_INSTANCES = "target_instances"
 
 def select_entries(tframe:config.TimeFrame, category:str, targets:list) -> list:
     """Select and return a list of entries from the database."""
-    if tframe.month == 0:
-        tframe_str = tframe.iso_format(month=False)
-    else:
-        tframe_str = tframe.iso_format()
-
+    params = list(tframe.date_range())
     query = f"""
     SELECT e.id, e.date, e.amount, targets.name, e.note 
     FROM {ENTRIES} AS e
     INNER JOIN targets ON e.target = targets.id
-    WHERE date LIKE '{tframe_str}'"""
+    WHERE date >= ? AND date < ?"""
 
     if category == "expense":
         query += " AND amount < 0"
@@ -30,23 +26,68 @@ def select_entries(tframe:config.TimeFrame, category:str, targets:list) -> list:
         query += " AND amount >= 0"
 
     if targets:
-        query += f" AND targets.name in {kdb.format_iter(targets)}"
+        query += f" AND targets.name in ({', '.join('?' * len(targets))})"
+        params.extend(targets)
+
+    # Entries are listed in the order they were added
+    query += " ORDER BY e.id"
 
-    return kdb.run_select_query(query)
+    return kdb.run_select_query(query, params)
 
 
 def sum_target(target_id:int, tframe:config.TimeFrame) -> int:
     """Sum entries with a specified target in a time period."""
-    tframe_str = tframe.iso_format()
     query = f"""
     SELECT SUM(amount) 
     FROM {ENTRIES} 
-    WHERE date LIKE '{tframe_str}' AND target = {target_id}
+    WHERE date >= ? AND date < ? AND target = {target_id}
     """
-    sum_amount = kdb.run_select_query(query)[0][0]
+    sum_amount = kdb.run_select_query(query, tframe.date_range())[0][0]
     return sum_amount if sum_amount else 0
 
 
+def sum_targets(tframe:config.TimeFrame) -> dict[int, int]:
+    """Sum entries for every target in a time period at once. Return a dict
+    of target id to sum; targets with no entries are left out.
+    """
+    query = f"""
+    SELECT target, SUM(amount)
+    FROM {ENTRIES}
+    WHERE date >= ? AND date < ?
+    GROUP BY target
+    """
+    return dict(kdb.run_select_query(query, tframe.date_range()))
+
+
+def sum_target_instances(target_id:int, tframe:config.TimeFrame) -> tuple[int, int]:
+    """Count and sum the instances of a target in a time period."""
+    query = f"""
+    SELECT COUNT(*), SUM(amount)
+    FROM {TARGET_INSTANCES}
+    WHERE target = {target_id} AND year = {tframe.year}"""
+    if tframe.month:
+        query += f" AND month = {tframe.month.value}"
+
+    count, sum_amount = kdb.run_select_query(query)[0]
+    return (count, sum_amount if sum_amount else 0)
+
+
+def sum_targets_instances(tframe:config.TimeFrame) -> dict[int, tuple[int, int]]:
+    """Count and sum the instances of every target in a time period at once.
+    Return a dict of target id to (count, sum); targets with no instances
+    are left out.
+    """
+    query = f"""
+    SELECT target, COUNT(*), SUM(amount)
+    FROM {TARGET_INSTANCES}
+    WHERE year = {tframe.year}"""
+    if tframe.month:
+        query += f" AND month = {tframe.month.value}"
+    query += " GROUP BY target"
+
+    return {t: (count, sum_amount) for t, count, sum_amount in kdb.run_select_query(query)}
+
+
 target_table_query = f"""
 CREATE TABLE IF NOT EXISTS {TARGETS} (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -74,10 +115,27 @@ CREATE TABLE IF NOT EXISTS {ENTRIES} (
     FOREIGN KEY (target) REFERENCES targets (id)
 );"""
 
+entries_target_index_query = f"""
+CREATE INDEX IF NOT EXISTS {ENTRIES}_target ON {ENTRIES} (target);"""
+
+entries_date_index_query = f"""
+CREATE INDEX IF NOT EXISTS {ENTRIES}_date ON {ENTRIES} (date);"""
+
+# Instances are always looked up by month or year, then target
+target_instances_month_index_query = f"""
+CREATE INDEX IF NOT EXISTS {TARGET_INSTANCES}_month
+ON {TARGET_INSTANCES} (year, month, target);"""
+
 
-kdb.run_query(target_table_query)
-kdb.run_query(target_instances_table_query)
-kdb.run_query(entries_table_query)
+# Create the schema at startup in one round trip and transaction
+kdb.run_script("\n".join((
+    target_table_query,
+    target_instances_table_query,
+    entries_table_query,
+    entries_target_index_query,
+    entries_date_index_query,
+    target_instances_month_index_query,
+)))
 
 # logging.info(kdb.run_select_query("SELECT * FROM target_instances"))
 # logging.info(run_select_query("SELECT * FROM targets"))
@@ -3,15 +3,22 @@ from __future__ import annotations
 import datetime
 import logging
 from datetime import date
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from kelevsma import db as kdb
 
 import config
 import db
 import target
-from config import DATEW, AMOUNTW, TARGETW
-from util import dollar_str, cents_to_dollars
+from config import ENTRY_FORMAT
+from util import dollar_str, cents_str, date_str
+
+
+# Results of select() keyed by filter, least recently used first; cleared
+# whenever entries or targets change
+_select_cache: dict[tuple, list[Entry]] = {}
+# Filters to keep results for, e.g. the current and the previous month
+SELECT_CACHE_SIZE = 2
 
 
 @dataclass(slots=True)
@@ -23,9 +30,16 @@ class Entry:
     targ: str
     note: str
     target: target.Target = None
+    # The formatted row, made on first use. Entries aren't modified after
+    # they're displayed; edits build a new Entry
+    _str: str = field(default=None, init=False, repr=False, compare=False)
+
+    # Column names in the order fields_and_values() returns them
+    db_fields = ("id", "date", "amount", "target", "note")
     
     def __post_init__(self) -> None:
-        self.target = target.select_one(self.targ)
+        if self.target is None:
+            self.target = target.select_one(self.targ)
 
     @property
     def category(self) -> str:
@@ -40,45 +54,32 @@ class Entry:
         return config.TimeFrame(self.date.year, self.date.month)
 
     @classmethod
-    def from_tuple(cls, data:tuple):
+    def from_tuple(cls, data:tuple, targ:target.Target=None):
         """Construct an entry from a database row (tuple)."""
         id, date, amount, target, note = data
-        id = int(id)
-        date = datetime.date.fromisoformat(date)
-        amount = int(amount)
-
-        return cls(id, date, amount, target, note)
+        return cls(id, datetime.date.fromisoformat(date), amount, target, note, targ)
 
     def fields_and_values(self) -> tuple[tuple]:
         """Return the fields and values for an SQL insert."""
-        date = self.date.isoformat()
-        d = {
-            "id":       self.id,
-            "date":     date,
-            "amount":   self.amount,
-            "target":   self.target.id,
-            "note":     self.note
-        }
+        values = (self.id, self.date.isoformat(), self.amount, self.target.id, self.note)
         if not self.id:
-            d.pop("id")
-
-        return (tuple(d.keys()), tuple(d.values()))
+            return (self.db_fields[1:], values[1:])
+        return (self.db_fields, values)
 
     def to_csv(self) -> tuple:
         """Serialize entry for writing to csv."""
         date = self.date.isoformat()
-        amount = cents_to_dollars(self.amount)
+        amount = cents_str(self.amount)
         targ = self.target.name
         note = self.note
 
         return (date, amount, targ, note)
 
     def __str__(self) -> str:
-        date = self.date.strftime("%b %d")
-        return f"{date:{DATEW}}"\
-        f"{dollar_str(self.amount):{AMOUNTW}}"\
-        f"{self.target.name:{TARGETW}}"\
-        f"{self.note}"
+        if self._str is None:
+            self._str = ENTRY_FORMAT.format(date_str(self.date),
+                dollar_str(self.amount), self.target.name, self.note)
+        return self._str
 
     def __add__(self, other) -> int:
         if type(other) == type(self):
@@ -93,29 +94,48 @@ class Entry:
 
 def insert(entry:Entry) -> Entry:
     """Insert an entry into the database."""
-    # Make a target instance for this month if it doesn't exist
-    targ = entry.target
-    if not targ.instance_exists(entry.tframe):
-        targ.set_instance(entry.tframe, targ.default_amt)
+    with kdb.transaction():
+        # Make a target instance for this month if it doesn't exist
+        entry.target.ensure_instance(entry.tframe)
 
-    # Save the id as some entries won't have an id until inserted
-    entry.id = kdb.insert_row(db.ENTRIES, *entry.fields_and_values()).lastrowid
+        # Save the id as some entries won't have an id until inserted
+        entry.id = kdb.insert_row(db.ENTRIES, *entry.fields_and_values()).lastrowid
+    clear_cache()
     return entry
 
 
 def delete(entry:Entry) -> None:
     """Delete an entry from the database."""
     kdb.delete_row_by_id(db.ENTRIES, entry.id)
+    clear_cache()
 
 
 def update(entry:Entry) -> None:
     """Update an entry in the database."""
     fields, values = entry.fields_and_values()
     kdb.update_row(db.ENTRIES, entry.id, fields[1:], values[1:])
+    clear_cache()
 
 
 def select(tframe:config.TimeFrame, category:str, targets:list) -> list[Entry]:
-    """Select entries from the database."""
-    entry_tuples = db.select_entries(tframe, category, targets)
-    return [Entry.from_tuple(e) for e in entry_tuples]
-    
\ No newline at end of file
+    """Select entries from the database. Results for the last
+    SELECT_CACHE_SIZE filters used are cached until the next write to
+    entries or targets.
+    """
+    key = (tframe.year, tframe.month, category, tuple(targets))
+    entries = _select_cache.pop(key, None)
+    if entries is None:
+        entry_tuples = db.select_entries(tframe, category, targets)
+        names = {e[3] for e in entry_tuples}
+        targs = {n: target.select_one(n) for n in names}
+        entries = [Entry.from_tuple(e, targs[e[3]]) for e in entry_tuples]
+        if len(_select_cache) >= SELECT_CACHE_SIZE:
+            del _select_cache[next(iter(_select_cache))]
+    # (Re)insert so the dict stays in order of use
+    _select_cache[key] = entries
+    return entries
+
+
+def clear_cache() -> None:
+    """Forget cached select results."""
+    _select_cache.clear()
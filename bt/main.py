@@ -24,19 +24,25 @@ import target
 import entry
 import util
 
-from config import TimeFrame, DATEW, AMOUNTW, TARGETW, NAMEW, ENTRIES, TARGETS, GRAPH
+from config import TimeFrame, ENTRIES, TARGETS, GRAPH, ENTRIES_HEADER, TARGETS_HEADER
 from screens import GraphScreen
 
 
-def push_targets() -> None:
-    """Push the current targets to the current screen"""
-    year = config.target_filter_state.tframe.year
-    month = config.target_filter_state.tframe.month.name
+def select_shown_targets() -> list[target.Target]:
+    """Return the targets to show for the current target filter."""
     targets = target.select()
     # If a specific month is selected, don't show targets with a default of 0
     if config.target_filter_state.tframe.month.value:
         targets = [t for t in targets if t.default_amt or t.goal]
-    kelevsma.push_h(f"   {'NAME':{NAMEW}}{'PROGRESS'}")
+    return targets
+
+
+def push_targets() -> None:
+    """Push the current targets to the current screen"""
+    year = config.target_filter_state.tframe.year
+    month = config.target_filter_state.tframe.month.name
+    targets = select_shown_targets()
+    kelevsma.push_h(TARGETS_HEADER)
     kelevsma.push(*targets)
     kelevsma.push_f(f"Showing targets for {month} of {year}.")
 
@@ -48,7 +54,7 @@ def push_entries() -> None:
     entry_summary = get_entry_summary(len(entries), s.tframe, s.category, s.targets)
     target_progress = get_target_progress(s.targets)
 
-    kelevsma.push_h(f"   {'DATE':{DATEW}}{' AMOUNT':{AMOUNTW}}{'TARGET':{TARGETW}}{'NOTE'}")
+    kelevsma.push_h(ENTRIES_HEADER)
     kelevsma.push(*entries)
     kelevsma.push_f(" ", target_progress, entry_summary)
 
@@ -69,8 +75,8 @@ def get_target_progress(target_names:list[str]) -> str:
         target_names = target.select()
     else:
         target_names = [target.select_one(t) for t in target_names]
-    current = sum([t.current_total for t in target_names])
-    goal = sum([t.goal for t in target_names])
+    current = sum(t.current_total for t in target_names)
+    goal = sum(t.goal for t in target_names)
     if current < goal:
         style = f"{Style.BRIGHT}{Fore.RED}"
     else:
@@ -82,9 +88,7 @@ def push_target_graph() -> None:
     """Push the graph for the current targets to the current screen."""
     year = config.target_filter_state.tframe.year
     month = config.target_filter_state.tframe.month.name
-    targets = target.select()
-    if config.target_filter_state.tframe.month.value:
-        targets = [t for t in targets if t.default_amt or t.goal]
+    targets = select_shown_targets()
 
     kelevsma.push(*targets)
     kelevsma.push_f("NOTE: Green bars are meeting their goal, red ones are not.")
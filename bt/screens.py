@@ -1,5 +1,5 @@
 """A module for custom screens."""
-from colorama import Back, Fore, Style
+from colorama import Back, Style
 
 from kelevsma.display import BodyLines, Screen, Line, t_width
 from util import dollar_str
@@ -7,18 +7,20 @@ from util import dollar_str
 
 class TargetGraphBody(BodyLines):
     """Replaces Screen body to print targets in graph format."""
-    def prepare_lines(self) -> list[Line]:
-        """Prepare the lines for the graph."""
+    def prepare_lines(self, objs:list=None) -> list[Line]:
+        """Prepare the lines for the graph, or only for objs if given."""
+        if objs is None:
+            objs = self
         width = int(t_width() * .75)
         if odd_width := (width % 2):
             width -= 1
         margin = (t_width() - width) // 2
         max_bar_len = width // 2
-        extreme = max([abs(t.current_total) for t in self])
+        extreme = max(abs(t.current_total) for t in self)
 
         # Loop through targets and format them as Lines
         lines = []
-        for t in self:
+        for t in objs:
             total = t.current_total
             total_str = dollar_str(total)
             ratio = (abs(total) / extreme) if total else 0
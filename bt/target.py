@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import logging
 
 from colorama import Fore
@@ -7,24 +9,46 @@ import entry
 import kelevsma.db as kdb
 import db
 
-from config import NAMEW
+from config import TARGET_FORMAT
+from util import dollar_str
+
+
+# Target rows keyed by name; None until first needed and after targets change
+_rows_by_name: dict[str, tuple] | None = None
 
 
 class Target:
     """Class for manipulating and printing rows from the targets table."""
-    __slots__ = ("id", "name", "default_amt", "current_total", "goal")
+    __slots__ = ("id", "name", "default_amt", "_current_total", "_goal")
     id: int
     name: str
     default_amt: int
-    current_total: int
-    goal: int
 
-    def __init__(self, id:int, name:str, default_amt:int) -> None:
+    # Column names in the order fields_and_values() returns them
+    db_fields = ("id", "name", "default_amt")
+
+    def __init__(self, id:int, name:str, default_amt:int, current_total:int=None,
+    instances:tuple[int, int]=None) -> None:
         self.id = id
         self.name = name
         self.default_amt = default_amt
-        self.current_total = self.get_current_total()
-        self.goal = self.get_goal()
+        # Queried on first access unless given
+        self._current_total = current_total
+        self._goal = None
+        if instances is not None:
+            self._goal = self.goal_from_instances(config.target_filter_state.tframe, *instances)
+
+    @property
+    def current_total(self) -> int:
+        if self._current_total is None:
+            self._current_total = self.get_current_total()
+        return self._current_total
+
+    @property
+    def goal(self) -> int:
+        if self._goal is None:
+            self._goal = self.get_goal()
+        return self._goal
 
     def get_current_total(self) -> int:
         """Return the amount sum for entries with this 
@@ -37,16 +61,14 @@ class Target:
         """Return the goal with respect to current timeframe."""
         if not tframe:
             tframe = config.target_filter_state.tframe
-        if tframe.month:
-            expected_n_instances = 1
-            instances = kdb.select_rows(db.TARGET_INSTANCES,
-                target=self.id, year=tframe.year, month=tframe.month.value)
-        else:
-            expected_n_instances = 12
-            instances = kdb.select_rows(db.TARGET_INSTANCES, target=self.id, year=tframe.year)
-            
-        instances_sum = sum([x[2] for x in instances])
-        diff = expected_n_instances - len(instances)
+        return self.goal_from_instances(tframe, *db.sum_target_instances(self.id, tframe))
+
+    def goal_from_instances(self, tframe:config.TimeFrame, n_instances:int, instances_sum:int) -> int:
+        """Return the goal for a time frame from the count and sum of its
+        instances. Months without an instance count at the default amount.
+        """
+        expected_n_instances = 1 if tframe.month else 12
+        diff = expected_n_instances - n_instances
 
         if not diff:
             return instances_sum
@@ -56,50 +78,58 @@ class Target:
         """Return true if target is not meeting goal."""
         return self.current_total < self.goal
 
-    def instance_exists(self, tframe:config.TimeFrame) -> bool:
-        """Return true if an instance exists in the db with this 
-        target and time frame.
+    def ensure_instance(self, tframe:config.TimeFrame) -> None:
+        """Insert an instance at the default amount for the time frame if
+        none exists yet.
         """
-        return bool(kdb.select_rows(db.TARGET_INSTANCES, 
-                target=self.id, year=tframe.year, month=tframe.month.value))
+        query = f"""
+        INSERT INTO {db.TARGET_INSTANCES} (target, amount, year, month)
+        SELECT ?, ?, ?, ?
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {db.TARGET_INSTANCES}
+            WHERE target = ? AND year = ? AND month = ?
+        )"""
+        year, month = tframe.year, tframe.month.value
+        values = (self.id, self.default_amt, year, month, self.id, year, month)
+        kdb.run_query(query, values)
 
     def set_instance(self, tframe:config.TimeFrame, amount:int) -> None:
-        """Set the target amount for the specified month. Start by deleting the 
-        old target instance if it exists, and then insert a new one.
+        """Set the target amount for the specified month. Update the target
+        instance in place, and only insert a new one if none was updated.
         """
-        del_fields = ("target", "year", "month")
-        del_values = (self.id, tframe.year, tframe.month.value)
+        query = f"""
+        UPDATE {db.TARGET_INSTANCES}
+        SET amount = ?
+        WHERE target = ? AND year = ? AND month = ?
+        """
+        values = (amount, self.id, tframe.year, tframe.month.value)
+
+        with kdb.transaction():
+            cursor = kdb.run_query(query, values)
+            if cursor and not cursor.rowcount:
+                ins_fields = ("amount", "target", "year", "month")
+                kdb.insert_row(db.TARGET_INSTANCES, ins_fields, values)
 
-        ins_fields = ("target", "amount", "year", "month")
-        ins_values = (self.id, amount, tframe.year, tframe.month.value)
-        
-        if kdb.delete_row_by_value(db.TARGET_INSTANCES, del_fields, del_values):
-            # If first query works, run the next one
-            kdb.insert_row(db.TARGET_INSTANCES, ins_fields, ins_values)
+    def clone(self) -> Target:
+        """Return a new Target for the same row."""
+        return Target(self.id, self.name, self.default_amt)
 
     def fields_and_values(self) -> tuple[tuple]:
         """Return the fields and values for an SQL insert."""
-        d = {
-            "id":           self.id,
-            "name":         self.name,
-            "default_amt":  self.default_amt,
-        }
+        values = (self.id, self.name, self.default_amt)
         if not self.id:
-            d.pop("id")
-
-        return (tuple(d.keys()), tuple(d.values()))
+            return (self.db_fields[1:], values[1:])
+        return (self.db_fields, values)
 
     def times_used(self) -> int:
         """Return the number of times target is used in the database."""
-        query = f"SELECT * FROM entries WHERE target = {self.id}"
-        return len(kdb.run_select_query(query))
+        query = f"SELECT COUNT(*) FROM {db.ENTRIES} WHERE target = {self.id}"
+        return kdb.run_select_query(query)[0][0]
 
     def __str__(self) -> str:
-        name = self.name[:NAMEW]
-        current = entry.dollar_str(self.current_total)
-        goal = entry.dollar_str(self.goal)
-        string =  f"{name:{NAMEW}}{current} / {goal}"
-        default = entry.dollar_str(self.default_amt)
+        goal = dollar_str(self.goal)
+        string = TARGET_FORMAT.format(self.name, dollar_str(self.current_total), goal)
+        default = dollar_str(self.default_amt)
         if goal != default and config.target_filter_state.tframe.month.value:
             string += f" (default: {default})"
         if self.failing():
@@ -110,34 +140,60 @@ class Target:
 def insert(target:Target) -> Target:
     """Adds a new target to the database."""
     target.id = kdb.insert_row(db.TARGETS, *target.fields_and_values()).lastrowid
+    clear_cache()
     return target
 
 
 def delete(target:Target) -> None:
     """Removes a target from the database."""
     kdb.delete_row_by_id(db.TARGETS, target.id)
+    clear_cache()
 
 
 def update(target:Target) -> None:
     """Update a target."""
     fields, values = target.fields_and_values()
     kdb.update_row(db.TARGETS, target.id, fields[1:], values[1:])
+    clear_cache()
 
 
 def select() -> list[Target]:
     """Return one target or the whole list of targets as Target objects."""
-    target_tuples = kdb.select_rows(db.TARGETS)
-    return [Target(*t) for t in target_tuples]
+    target_tuples = get_rows_by_name().values()
+    tframe = config.target_filter_state.tframe
+    totals = db.sum_targets(tframe)
+    instances = db.sum_targets_instances(tframe)
+    return [Target(*t, totals.get(t[0], 0), instances.get(t[0], (0, 0))) for t in target_tuples]
 
 
 def select_one(name:str) -> Target | None:
     """Return a single target from the database."""
-    target_tuples = kdb.select_rows(db.TARGETS, name=name)
-    if not target_tuples:
+    row = get_rows_by_name().get(name)
+    if not row:
         return None
-    return Target(*target_tuples[0])
+    return Target(*row)
+
+
+def any_exist() -> bool:
+    """Return True if at least one target is in the database."""
+    return bool(get_rows_by_name())
 
 
 def get_target_names() -> list[str]:
     """Return a list of the target names."""
-    return [t.name for t in select()]
+    return list(get_rows_by_name())
+
+
+def get_rows_by_name() -> dict[str, tuple]:
+    """Return target rows keyed by name, cached until the next write to targets."""
+    global _rows_by_name
+    if _rows_by_name is None:
+        _rows_by_name = {row[1]: row for row in kdb.select_rows(db.TARGETS)}
+    return _rows_by_name
+
+
+def clear_cache() -> None:
+    """Forget the cached target rows and the entries that refer to them."""
+    global _rows_by_name
+    _rows_by_name = None
+    entry.clear_cache()
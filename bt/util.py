@@ -2,6 +2,7 @@
 
 import enum
 import datetime
+from decimal import Decimal, InvalidOperation
 from dataclasses import dataclass
 
 
@@ -21,6 +22,16 @@ class Month(enum.IntEnum):
     December = 12
 
 
+# Short month names indexed by month number, for display without strftime
+MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def date_str(date:datetime.date) -> str:
+    """Format a date for display, e.g. 'Mar 05'."""
+    return f"{MONTH_ABBR[date.month]} {date.day:02}"
+
+
 this_year = datetime.date.today().year
 this_month = datetime.date.today().month
 
@@ -33,30 +44,32 @@ class TimeFrame:
         self.year = year
         self.month = Month(month)
 
-    def iso_format(self, *, month:bool=True) -> str:
-        """Return date in iso format for querying db."""
+    def date_range(self) -> tuple[str, str]:
+        """Return the iso date bounds of the time frame, as [start, end)."""
         if self.month.value:
-            return f"{self.year}-{self.month.value:02}-%"
-        return f"{self.year}-%"
+            return (f"{self.year}-{self.month.value:02}", f"{self.year}-{self.month.value + 1:02}")
+        return (f"{self.year}", f"{self.year}-13")
 
 
 def dollar_str(amount:int) -> str:
     """Formats a cent amount for display in dollars."""
-    amount = cents_to_dollars(amount)
-    if amount >= 0:
-        return f"+${amount:.2f}"
-    else:
-        return f"-${abs(amount):.2f}"      
+    sign = "+" if amount >= 0 else "-"
+    return f"{sign}${cents_str(abs(amount))}"
 
 
-def cents_to_dollars(cent_amount:int) -> float:
-    """Convert a cent amount to dollars."""
-    if not cent_amount:
-        return float(0)
-    return cent_amount / 100
+def cents_str(cent_amount:int) -> str:
+    """Format a cent amount as plain dollars with integer math, e.g. -1250
+    becomes '-12.50'.
+    """
+    sign = "-" if cent_amount < 0 else ""
+    dollars, cents = divmod(abs(cent_amount), 100)
+    return f"{sign}{dollars}.{cents:02}"
 
 
 def dollars_to_cents(dollar_amount:str) -> int:
     """Convert a string dollar ammount to cents for storage."""
-    return int(float(dollar_amount) * 100)
+    try:
+        return int(Decimal(dollar_amount) * 100)
+    except InvalidOperation:
+        raise ValueError(f"Invalid dollar amount: '{dollar_amount}'")
     
\ No newline at end of file
@@ -1,11 +1,26 @@
 from kelevsma.validator import Validator, Result
 
-import entry
 import target
 import util
 from config import KEYWORDS, Month
 
 
+def month_prefixes(allow_any:bool) -> dict[str, Month]:
+    """Map every prefix of every month name to the first month it matches."""
+    prefixes = {}
+    for month in Month:
+        if not allow_any and not month.value:
+            continue
+        name = month.name.lower()
+        for i in range(len(name) + 1):
+            prefixes.setdefault(name[:i], month)
+    return prefixes
+
+
+# Month prefixes for VMonth, keyed by whether "all" is allowed
+MONTH_PREFIXES = {True: month_prefixes(True), False: month_prefixes(False)}
+
+
 class VMonth(Validator):
     """Verify that input refers to a month; if so, return it as int."""
     def __init__(self, allow_any:bool=True, *args, **kwargs) -> None:
@@ -13,15 +28,10 @@ class VMonth(Validator):
         self.allow_any = allow_any
 
     def validate(self, value) -> Result:
-        name = value.lower()
-        for month in Month:
-            if not self.allow_any and not month.value:
-                continue
-            if not month.name.lower().startswith(name): 
-                continue
-            return Result.ok(month)
-        
-        return Result.err()
+        month = MONTH_PREFIXES[self.allow_any].get(value.lower())
+        if month is None:
+            return Result.err()
+        return Result.ok(month)
 
 
 class VDay(Validator):
@@ -50,8 +60,7 @@ class VTarget(Validator):
             return Result.err()
             
         ret_val = [Result.ok(value), Result.err()]
-        a = target.get_target_names()
-        if value not in target.get_target_names():
+        if value not in target.get_rows_by_name():
             ret_val.reverse()
 
         return ret_val[self.invert]
@@ -82,13 +91,13 @@ class VAmount(Validator):
 
 class VType(Validator):
     """Capture the type of entry."""
+    categories = {"income": "income", "expense": "expense", "expenses": "expense"}
+
     def validate(self, value:str) -> Result:
-        value = value.lower()
-        if value == "income":
-            return Result.ok("income")
-        elif value in ("expense", "expenses"):
-            return Result.ok("expense")
-        return Result.err()
+        category = self.categories.get(value.lower())
+        if category is None:
+            return Result.err()
+        return Result.ok(category)
 
 
 class VID(Validator):
@@ -14,12 +14,18 @@ def push_shortcuts() -> None:
     display.push_h(f"{'SHORTCUT':11}  COMMAND")
     display.push(*[f"/{k:10}  {v}" for k, v in command.controller.shortcut_map.items()])
 
+def split_input(text:str) -> list[str]:
+    """Split a line of input into args."""
+    if '"' in text or "'" in text or "\\" in text:
+        return shlex.split(text)
+    return text.split()
+
 def prof_run(*commands:str, times:int=1) -> None:
     """Run the program for profiling purposes. Does not block for input."""
     command.set_shortcuts(shortcut.select_all())
     for _ in range(times):
         for c in commands:
-            command.controller.route_command(shlex.split(c))
+            command.controller.route_command(split_input(c))
             display.refresh()
 
 def run(init_cmd:str="") -> None:
@@ -32,12 +38,12 @@ def run(init_cmd:str="") -> None:
     command.set_shortcuts(shortcut.select_all())
 
     if init_cmd:
-        command.controller.route_command(shlex.split(init_cmd))
+        command.controller.route_command(split_input(init_cmd))
         display.refresh()
     
     while True:
         try:
-            user_input = shlex.split(input())
+            user_input = split_input(input())
             command.controller.route_command(user_input)
         except (display.DisplayError) as e:
             display.error(e)
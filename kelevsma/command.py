@@ -31,6 +31,9 @@ class CommandController:
         self.undo_stack = []
         self.redo_stack = []
         self.shortcut_map = {}
+        # Whether each command class's execute takes parameters, found by
+        # inspecting it the first time the class is executed
+        self.takes_data = {}
 
     def register(self, command:Command) -> None:
         """Attach the controller to the command and append command to commands list"""
@@ -64,9 +67,13 @@ class CommandController:
         parameters."""
         if hasattr(command, "screen"):
             display.controller.switch_to(command.screen)
-        argspec = inspect.getfullargspec(command.execute)
-        # If more than just self is specified, include **data in the call
-        if len(argspec.args) > 1:
+        cls = type(command)
+        takes_data = self.takes_data.get(cls)
+        if takes_data is None:
+            # If more than just self is specified, include **data in the call
+            argspec = inspect.getfullargspec(cls.execute)
+            takes_data = self.takes_data[cls] = len(argspec.args) > 1
+        if takes_data:
             command.execute(**command.data)
         else:
             command.execute()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import sqlite3
 import typing
 import logging
+import contextlib
 
 import kelevsma
 
@@ -10,6 +11,10 @@ import kelevsma
 SHORTCUTS = "shortcuts"
 
 
+# How many transaction() blocks are open; commits are held while above 0
+_transaction_depth = 0
+
+
 def format_iter(iter:typing.Iterable) -> str:
     """Format an iterable to be used in an SQL query."""
     iter = [f"'{x}'" if  type(x) is str else str(x) for x in iter]
@@ -24,15 +29,46 @@ def run_query(query:str, params=()) -> sqlite3.Cursor | None:
     except sqlite3.Error as e:
         kelevsma.error("Database error")
     else:
-        connection.commit()
+        if not _transaction_depth:
+            connection.commit()
         return cursor
 
 
-def run_select_query(query:str) -> list[tuple|None]:
+def run_script(script:str) -> None:
+    """Execute several SQL statements in one call and one transaction."""
+    try:
+        connection.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+    except sqlite3.Error:
+        connection.rollback()
+        kelevsma.error("Database error")
+
+
+@contextlib.contextmanager
+def transaction() -> typing.Iterator[None]:
+    """Run the queries in the block as one transaction. Blocks may be
+    nested; only the outermost one commits, or rolls back if the block
+    raised.
+    """
+    global _transaction_depth
+    _transaction_depth += 1
+    try:
+        yield
+    except BaseException:
+        _transaction_depth -= 1
+        if not _transaction_depth:
+            connection.rollback()
+        raise
+    else:
+        _transaction_depth -= 1
+        if not _transaction_depth:
+            connection.commit()
+
+
+def run_select_query(query:str, params=()) -> list[tuple|None]:
     """Run an SQL SELECT Query."""
     cursor = connection.cursor()
     try:
-        cursor.execute(query)
+        cursor.execute(query, params)
         items = cursor.fetchall()
     except sqlite3.Error as e:
         kelevsma.error(f"Database error")
@@ -61,7 +97,7 @@ def insert_row(table_name:str, fields:tuple, values:tuple) -> sqlite3.Cursor | N
     """Inserts a row into the database, given the table, fields, and values."""
     query = f"""
     INSERT INTO {table_name} {format_iter(fields)}
-    VALUES ({", ".join(['?' for _ in range(len(values))])})
+    VALUES ({", ".join('?' * len(values))})
     """
 
     return run_query(query, values)
@@ -102,6 +138,8 @@ CREATE TABLE IF NOT EXISTS {SHORTCUTS} (
 
 try:
     connection = sqlite3.connect("db.db")
+    # Commits append to a write-ahead log
+    connection.execute("PRAGMA journal_mode=WAL")
 except sqlite3.Error:
     kelevsma.error("Database connection error.")
     quit()
@@ -1,10 +1,8 @@
 """Module to handle displaying output in terminal."""
 from __future__ import annotations
-from fileinput import filename
 
 import os
 import logging
-import collections
 import time
 from dataclasses import dataclass
 from typing import Any, Callable
@@ -20,6 +18,13 @@ class DisplayError(Exception):
     pass
 
 
+# Cursor home, clear screen, clear scrollback
+CLEAR_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
+# Last terminal size read by update_terminal_size()
+_terminal_size: os.terminal_size | None = None
+
+
 @dataclass(slots=True)
 class Line:
     """Represents a single line to be printed. Holds a reference to the
@@ -31,7 +36,7 @@ class Line:
         return self.text
 
 
-class LineGroup(collections.UserList):
+class LineGroup(list):
     """A group of lines for printing."""
 
     def __init__(self, number:bool=False, trunc:bool=False, bold:bool=False, *args, **kwargs) -> None:
@@ -40,8 +45,12 @@ class LineGroup(collections.UserList):
         self.trunc = trunc
         self.bold = bold
     
-    def prepare_lines(self) -> list[Line]:
-        """Return a list of lines that won't overflow."""
+    def prepare_lines(self, objs:list=None) -> list[Line]:
+        """Return a list of lines that won't overflow. Lines are made from
+        all items unless a list of objs is given.
+        """
+        if objs is None:
+            objs = self
         lines = []
         width = t_width()
         if self.number:
@@ -49,11 +58,11 @@ class LineGroup(collections.UserList):
 
         # For truncated line output
         if self.trunc:
-            lines.extend([Line(obj, str(obj)[:width]) for obj in self])
+            lines.extend([Line(obj, str(obj)[:width]) for obj in objs])
             return lines
 
         # For full output
-        for obj in self:
+        for obj in objs:
             src_string = str(obj)
             first_line = True
             obj_lines = []
@@ -128,18 +137,32 @@ class BodyLines(LineGroup):
     def select(self, index: int) -> Any:
         """Return an item by line number from the current page."""
         start, end = self.get_current_range()
-        items = list(self)[start:end][::-1]
+        items = self[start:end]
         if index > len(items) or index < 1:
             raise DisplayError("Invalid line selection.")
 
-        self.selected = items[index-1]
+        self.selected = items[-index]
         return self.selected
 
+    def page_lines(self, start:int, end:int|None) -> list[Line]:
+        """Return the prepared lines in the range start to end. Every item
+        gives at least one line, so only the items that can reach the range
+        are prepared, unless they turn out to give too few lines.
+        """
+        if start < 0:
+            objs, needed = self[start:], -start
+        else:
+            objs, needed = self[:end], end
+        lines = self.prepare_lines(objs)
+        if len(lines) < needed and len(objs) < len(self):
+            lines = self.prepare_lines()
+        return lines[start:end]
+
     def print(self) -> list[str]:
         """Return all lines for printing if any exist."""
         lines = []
         start, end = self.get_current_range()
-        raw_lines: list[Line] = list(reversed(self.prepare_lines()[start:end]))
+        raw_lines: list[Line] = list(reversed(self.page_lines(start, end)))
 
         # Append lines
         # Prepend numbers and highlight if selected
@@ -206,8 +229,8 @@ class Screen:
             if enough:
                 continue
             clear_terminal()
-            print("\n" * (t_height()-1), end="")
-            print(f"Please increase the window {dim}.", end="")
+            padding = "\n" * (t_height()-1)
+            print(f"{padding}Please increase the window {dim}.", end="")
             return False
         return True
         
@@ -245,6 +268,7 @@ class Screen:
 
     def print(self) -> None:
         """Print the contents of the screen to the terminal."""
+        update_terminal_size()
         # Check the height before printing
         if not self.check_window_size():
             return
@@ -306,17 +330,27 @@ def clear_terminal() -> None:
     if os.name == "nt":
         os.system("cls")
     else:
-        os.system("clear")
+        print(CLEAR_SEQUENCE, end="")
+
+
+def update_terminal_size() -> None:
+    """Read the terminal size used by t_width and t_height."""
+    global _terminal_size
+    _terminal_size = os.get_terminal_size()
 
 
 def t_width() -> int:
-    """Return current terminal width in lines."""
-    return os.get_terminal_size()[0]
+    """Return terminal width in lines, as of the last print."""
+    if _terminal_size is None:
+        update_terminal_size()
+    return _terminal_size[0]
 
 
 def t_height() -> int:
-    """Return current terminal height in lines."""
-    return os.get_terminal_size()[1]
+    """Return terminal height in lines, as of the last print."""
+    if _terminal_size is None:
+        update_terminal_size()
+    return _terminal_size[1]
 
 
 def window_checker() -> None:
@@ -340,18 +374,21 @@ def add_screen(screen:Screen) -> None:
 
 def push(*items:Any) -> None:
     """Push an item to body."""
+    screen = controller.get_screen()
     for item in items:
-        controller.get_screen().push(item)
+        screen.push(item)
 
 def push_h(*items:Any) -> None:
     """Push an item to header."""
+    screen = controller.get_screen()
     for item in items:
-        controller.get_screen().push(item, target="header")
+        screen.push(item, target="header")
 
 def push_f(*items:Any) -> None:
     """Push an item to footer."""
+    screen = controller.get_screen()
     for item in items:
-        controller.get_screen().push(item, target="footer")
+        screen.push(item, target="footer")
 
 
 def select(index) -> Any:
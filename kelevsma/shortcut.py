@@ -19,13 +19,13 @@ def insert(short:str, full:str) -> None:
     """Insert a new shortcut into the db."""
     fields = ("shortform", "full")
     values = (short, full)
-    db.insert_row(db.SHORTCUTS, fields, values)
-    command.set_shortcuts(select_all())
+    if db.insert_row(db.SHORTCUTS, fields, values):
+        command.controller.shortcut_map[short] = full
 
 
 def delete(short:str) -> None:
     """Delete a shortcut from the db."""
     fields = ("shortform",)
     values = (short,)
-    db.delete_row_by_value(db.SHORTCUTS, fields, values)
-    command.set_shortcuts(select_all())
+    if db.delete_row_by_value(db.SHORTCUTS, fields, values):
+        command.controller.shortcut_map.pop(short, None)
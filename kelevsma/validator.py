@@ -1,13 +1,15 @@
 import abc
 from typing import Any
 
-from . import command, shortcut
+from . import command
 
 class ValidatorError(Exception):
     pass
 
 
 class Result:
+    __slots__ = ("_ok", "_value")
+
     def __init__(self, ok, value=None):
         self._ok: bool = ok
         self._value: Any = value
@@ -94,25 +96,14 @@ class VLit(Validator):
         super().__init__(*args, **kwargs)
         self.literal = literal
         self.strict = strict
-
-    def compare(self, lval: str, rval: str):
-        if self.strict:
-            return lval == rval
-        else:
-            return lval.lower() == rval.lower()
+        if type(literal) is str:
+            literal = (literal,)
+        elif not all(type(x) is str for x in literal):
+            raise command.CommandConfigError("Literal must be str or an iterable containing only str.")
+        self.literals = frozenset(literal if strict else (l.lower() for l in literal))
 
     def validate(self, value: str) -> Result:
-        found = False
-        if hasattr(self.literal, "__iter__") and type(self.literal) != str:
-            if not all([True if type(x) is str else False for x in self.literal]):
-                raise command.CommandConfigError("Literal must be str or an iterable containing only str.")
-            for l in self.literal:
-                if self.compare(value, l):
-                    found = True
-                    break
-        else: 
-            if self.compare(value, self.literal):
-                found = True
+        found = (value if self.strict else value.lower()) in self.literals
 
         if self.invert:
             found = not found
@@ -133,17 +124,15 @@ class VBool(Validator):
         super().__init__(*args, **kwargs)
         self.func = func
         self.lower = lower
+        if hasattr(str, func.__name__):
+            self.test = getattr(str, func.__name__)
+        else:
+            self.test = func
 
     def validate(self, value: str) -> Result:
         ret_val = None
-        # If it's a string method
-        if hasattr(str, self.func.__name__):
-            if getattr(value, self.func.__name__)():
-                ret_val = value
-        # If it's a function
-        else:
-            if self.func(value):
-                ret_val = value
+        if self.test(value):
+            ret_val = value
 
         if not ret_val:
             return Result.err()
@@ -208,8 +197,8 @@ class VShortcut(Validator):
             return Result.err()
 
         ret_val = [Result.ok(value), Result.err()]
-        shortcuts = sc if (sc := shortcut.select_all()) else []
-        if value not in shortcuts:
+        # The controller's map is kept in sync with the db on every change
+        if value not in command.controller.shortcut_map:
             ret_val.reverse()
 
         return ret_val[self.invert]